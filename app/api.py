@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from decimal import Decimal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError as PayloadError
 
-from app.domain.models import Balance, SettleRequest, SettleResponse, Transfer
+from app.domain.anytime import suggest_transfers_anytime
+from app.domain.models import (
+    AnytimeStats,
+    Balance,
+    NetHeader,
+    NetRequest,
+    NetResponse,
+    NetTrip,
+    SettleRequest,
+    SettleResponse,
+    Transfer,
+    TripAttribution,
+)
+from app.domain.netting import TripNetting
 from app.domain.settle import compute_balances, suggest_transfers_greedy
 from app.utils.errors import ValidationError
 
 router = APIRouter()
 
+# Trips per thread-pool hop when folding an NDJSON stream
+NET_STREAM_BATCH = 64
+
 
 @router.post("/api/settle", response_model=SettleResponse)
 def settle(payload: SettleRequest) -> SettleResponse:
@@ -26,9 +45,19 @@ def settle(payload: SettleRequest) -> SettleResponse:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
     # Build transfers
-    if payload.optimize != "greedy":
+    stats: AnytimeStats | None = None
+    if payload.optimize == "exact":
         raise HTTPException(status_code=501, detail="exact mode not implemented")
-    transfers_raw = suggest_transfers_greedy(balances_map, places=payload.rounding.places)
+    if payload.optimize == "anytime":
+        transfers_raw, stats_raw = suggest_transfers_anytime(
+            balances_map,
+            places=payload.rounding.places,
+            mode=payload.rounding.mode,
+            budget_ms=payload.time_budget_ms,
+        )
+        stats = AnytimeStats.model_validate(stats_raw)
+    else:
+        transfers_raw = suggest_transfers_greedy(balances_map, places=payload.rounding.places)
 
     balances = [Balance(person=p, amount=a) for p, a in balances_map.items()]
     transfers = [
@@ -52,4 +81,93 @@ def settle(payload: SettleRequest) -> SettleResponse:
         balances=balances,
         transfers=transfers,
         chart={"labels": labels, "values": values},
+        stats=stats,
+    )
+
+
+@router.post("/api/net", response_model=NetResponse)
+def net(payload: NetRequest) -> NetResponse:
+    # Fold every trip into one balance vector in the common base, then settle once
+    netting = TripNetting(payload.base_currency, payload.rounding.places, payload.rounding.mode)
+    try:
+        for trip in payload.trips:
+            netting.add(trip.model_dump())
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return _net_response(netting)
+
+
+@router.post("/api/net/stream", response_model=NetResponse)
+async def net_stream(request: Request) -> NetResponse:
+    # NDJSON body: one NetHeader line, then one NetTrip per line. Trips are folded in
+    # batches as they arrive, off the event loop, so the full set of expense lists is
+    # never held in memory and other requests/live sessions keep being served.
+    lines = _ndjson_lines(request)
+    header_line = await anext(lines, None)
+    if header_line is None:
+        raise HTTPException(status_code=422, detail="header line is required")
+    try:
+        header = NetHeader.model_validate_json(header_line)
+    except PayloadError as e:
+        raise HTTPException(status_code=422, detail=f"line 1: {e}") from e
+
+    netting = TripNetting(header.base_currency, header.rounding.places, header.rounding.mode)
+    lineno = 1
+    batch: list[bytes] = []
+    async for line in lines:
+        batch.append(line)
+        if len(batch) >= NET_STREAM_BATCH:
+            await run_in_threadpool(_fold_trip_lines, netting, batch, lineno)
+            lineno += len(batch)
+            batch = []
+    if batch:
+        await run_in_threadpool(_fold_trip_lines, netting, batch, lineno)
+    if not netting.attribution:
+        raise HTTPException(status_code=422, detail="at least one trip is required")
+    return await run_in_threadpool(_net_response, netting)
+
+
+def _fold_trip_lines(netting: TripNetting, lines: list[bytes], lineno: int) -> None:
+    for offset, line in enumerate(lines, start=lineno + 1):
+        try:
+            netting.add(NetTrip.model_validate_json(line).model_dump())
+        except (PayloadError, ValidationError) as e:
+            raise HTTPException(status_code=422, detail=f"line {offset}: {e}") from e
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    # Only newly received bytes are scanned for newlines; a partial line is kept as
+    # a list of pieces and joined once complete.
+    pending: list[bytes] = []
+    async for chunk in request.stream():
+        start = 0
+        while (end := chunk.find(b"\n", start)) != -1:
+            pending.append(chunk[start:end])
+            line = b"".join(pending)
+            pending = []
+            if line.strip():
+                yield line
+            start = end + 1
+        if start < len(chunk):
+            pending.append(chunk[start:])
+    line = b"".join(pending)
+    if line.strip():
+        yield line
+
+
+def _net_response(netting: TripNetting) -> NetResponse:
+    balances_map = netting.balances()
+    transfers_raw = suggest_transfers_greedy(balances_map, places=netting.places, mode=netting.mode)
+    return NetResponse(
+        base_currency=netting.base_currency,
+        balances=[Balance(person=p, amount=a) for p, a in balances_map.items()],
+        transfers=[
+            Transfer.model_validate({**t, "currency": netting.base_currency}) for t in transfers_raw
+        ],
+        trips=[
+            TripAttribution(
+                id=trip_id, balances=[Balance(person=p, amount=a) for p, a in amounts.items()]
+            )
+            for trip_id, amounts in netting.attribution
+        ],
     )
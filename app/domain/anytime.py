@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+
+from app.domain.settle import RoundingMode, _quantize, suggest_transfers_greedy
+
+Group = list[tuple[str, int]]
+
+
+def suggest_transfers_anytime(
+    balances: Mapping[str, Decimal],
+    places: int = 2,
+    mode: RoundingMode = "HALF_UP",
+    budget_ms: int = 200,
+    seed: int = 0,
+) -> tuple[list[dict[str, Decimal | str]], dict[str, Any]]:
+    """
+    Start from the greedy solution and keep improving it until the time budget runs out.
+
+    Settling a zero-sum group of m people takes m - 1 transfers, so n people split into
+    k zero-sum groups need n - k transfers. Each attempt shuffles the balances, peels off
+    zero-sum pairs, triples and quadruples, then cuts the rest wherever a running sum
+    returns to zero. The best partition seen is settled group by group with the greedy.
+    """
+    start = time.perf_counter()
+    deadline = start + budget_ms / 1000
+
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - start) * 1000, 3)
+
+    best = suggest_transfers_greedy(balances, places, mode)
+    improvements = [{"elapsed_ms": elapsed_ms(), "transfers": len(best), "source": "greedy"}]
+
+    unit = Decimal(10) ** -places
+    # same cent rounding the greedy applies to its input
+    cents = {p: _quantize(a, places) for p, a in balances.items()}
+    items = [(p, int(a / unit)) for p, a in cents.items() if a != 0]
+    creditors = sum(1 for _, a in items if a > 0)
+    # every group has >= 2 people, every creditor receives and every debtor pays at least once
+    lower_bound = max((len(items) + 1) // 2, creditors, len(items) - creditors)
+
+    rng = random.Random(seed)
+    iterations = 0
+    while len(best) > lower_bound and time.perf_counter() < deadline:
+        iterations += 1
+        groups = _random_partition(items, rng, deadline)
+        if groups is None:
+            break
+        if sum(len(g) - 1 for g in groups) >= len(best):
+            continue
+        transfers: list[dict[str, Decimal | str]] = []
+        for group in groups:
+            transfers.extend(
+                suggest_transfers_greedy({p: cents[p] for p, _ in group}, places, mode)
+            )
+        if len(transfers) < len(best):
+            best = transfers
+            improvements.append(
+                {"elapsed_ms": elapsed_ms(), "transfers": len(best), "source": "restart"}
+            )
+
+    stats = {
+        "budget_ms": budget_ms,
+        "elapsed_ms": elapsed_ms(),
+        "iterations": iterations,
+        "greedy_transfers": improvements[0]["transfers"],
+        "best_transfers": len(best),
+        "lower_bound": lower_bound,
+        "improvements": improvements,
+    }
+    return best, stats
+
+
+def _random_partition(
+    items: list[tuple[str, int]], rng: random.Random, deadline: float
+) -> list[Group] | None:
+    """One randomized attempt at splitting `items` into many zero-sum groups."""
+    remaining = list(items)
+    rng.shuffle(remaining)
+    groups: list[Group] = []
+    found, remaining = _peel_pairs(remaining)
+    groups.extend(found)
+    for finder in (_peel_triples, _peel_quads):
+        if time.perf_counter() >= deadline:
+            return None
+        found, remaining = finder(remaining, deadline)
+        groups.extend(found)
+
+    # whatever is left: cut a random order wherever the running sum returns to zero
+    rng.shuffle(remaining)
+    group: Group = []
+    running = 0
+    for item in remaining:
+        group.append(item)
+        running += item[1]
+        if running == 0:
+            groups.append(group)
+            group = []
+    if group:
+        groups.append(group)
+    return groups
+
+
+def _peel_pairs(items: list[tuple[str, int]]) -> tuple[list[Group], list[tuple[str, int]]]:
+    by_amount: dict[int, list[tuple[str, int]]] = {}
+    groups: list[Group] = []
+    for item in items:
+        partners = by_amount.get(-item[1])
+        if partners:
+            groups.append([partners.pop(), item])
+        else:
+            by_amount.setdefault(item[1], []).append(item)
+    rest = [item for bucket in by_amount.values() for item in bucket]
+    return groups, rest
+
+
+def _peel_triples(
+    items: list[tuple[str, int]], deadline: float
+) -> tuple[list[Group], list[tuple[str, int]]]:
+    # One side of a zero-sum triple is a single person, the other side two people
+    used = [False] * len(items)
+    index: dict[int, list[int]] = {}
+    for i, (_, amount) in enumerate(items):
+        index.setdefault(amount, []).append(i)
+
+    groups: list[Group] = []
+    for i, (_, a) in enumerate(items):
+        if used[i]:
+            continue
+        if time.perf_counter() >= deadline:
+            break
+        for j, (_, b) in enumerate(items):
+            if used[j] or j == i or (a > 0) == (b > 0):
+                continue
+            k = next((k for k in index.get(-a - b, ()) if not used[k] and k not in (i, j)), None)
+            if k is not None:
+                used[i] = used[j] = used[k] = True
+                groups.append([items[i], items[j], items[k]])
+                break
+    return groups, [item for i, item in enumerate(items) if not used[i]]
+
+
+def _peel_quads(
+    items: list[tuple[str, int]], deadline: float
+) -> tuple[list[Group], list[tuple[str, int]]]:
+    used = [False] * len(items)
+    pair_sums: dict[int, list[tuple[int, int]]] = {}
+    groups: list[Group] = []
+    for j in range(len(items)):
+        if time.perf_counter() >= deadline:
+            break
+        for i in range(j):
+            if used[i] or used[j]:
+                continue
+            s = items[i][1] + items[j][1]
+            match = next(
+                (
+                    (k, m)
+                    for k, m in pair_sums.get(-s, ())
+                    if not (used[k] or used[m]) and {k, m}.isdisjoint((i, j))
+                ),
+                None,
+            )
+            if match is not None:
+                k, m = match
+                used[i] = used[j] = used[k] = used[m] = True
+                groups.append([items[i], items[j], items[k], items[m]])
+            else:
+                pair_sums.setdefault(s, []).append((i, j))
+    return groups, [item for i, item in enumerate(items) if not used[i]]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+
+from app.domain.settle import RoundingMode, accumulate_expense, round_balances
+from app.utils.errors import DuplicateExpenseError, UnknownExpenseError
+
+
+class Ledger:
+    """
+    Raw balances for a live trip, kept in memory and updated one expense at a time.
+    Each add/edit/delete touches only the people on the affected expenses; `delta()`
+    reports which rounded balances changed since the previous call.
+    """
+
+    def __init__(
+        self,
+        people: Iterable[str],
+        rates: Mapping[str, Decimal],
+        places: int = 2,
+        mode: RoundingMode = "HALF_UP",
+    ) -> None:
+        self.people = list(people)
+        self.rates = dict(rates)
+        self.places = places
+        self.mode = mode
+        self.expenses: dict[str, Mapping] = {}
+        self._people = set(self.people)
+        self._raw: dict[str, Decimal] = {p: Decimal("0") for p in self.people}
+        self._published = self.balances()
+
+    def add(self, expense: Mapping) -> None:
+        if expense["id"] in self.expenses:
+            raise DuplicateExpenseError(f"duplicate expense id: {expense['id']}")
+        accumulate_expense(self._raw, expense, self._people, self.rates)
+        self.expenses[expense["id"]] = expense
+
+    def edit(self, expense: Mapping) -> None:
+        previous = self._get(expense["id"])
+        # apply the new version first so a rejected edit leaves the ledger untouched
+        accumulate_expense(self._raw, expense, self._people, self.rates)
+        accumulate_expense(self._raw, previous, self._people, self.rates, sign=-1)
+        self.expenses[expense["id"]] = expense
+
+    def delete(self, expense_id: str) -> None:
+        previous = self._get(expense_id)
+        accumulate_expense(self._raw, previous, self._people, self.rates, sign=-1)
+        del self.expenses[expense_id]
+
+    def balances(self) -> dict[str, Decimal]:
+        return round_balances(self._raw, self.places, self.mode)
+
+    def delta(self) -> dict[str, Decimal]:
+        current = self.balances()
+        changed = {p: a for p, a in current.items() if self._published.get(p) != a}
+        self._published = current
+        return changed
+
+    def _get(self, expense_id: str) -> Mapping:
+        if expense_id not in self.expenses:
+            raise UnknownExpenseError(f"unknown expense id: {expense_id}")
+        return self.expenses[expense_id]
@@ -3,7 +3,7 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 RoundingMode = Literal["HALF_UP", "HALF_EVEN"]
 
@@ -21,6 +21,7 @@ class Expense(BaseModel):
     participants: list[str] = Field(min_length=1)
     weights: list[Decimal] | None = None
     note: str | None = None
+    count: int = Field(default=1, ge=1, le=100_000)  # repeated occurrences, e.g. breakfast x 21
 
 
 class SettleRequest(BaseModel):
@@ -29,7 +30,32 @@ class SettleRequest(BaseModel):
     rates: dict[str, Decimal]
     rounding: Rounding = Rounding()
     expenses: list[Expense]
-    optimize: Literal["greedy", "exact"] = "greedy"
+    optimize: Literal["greedy", "exact", "anytime"] = "greedy"
+    time_budget_ms: int = Field(default=200, ge=1, le=10_000)  # anytime only
+
+
+class LiveOpen(BaseModel):
+    """First message on a live trip session; ignored when the session already exists."""
+
+    op: Literal["open"] = "open"
+    people: list[str] = Field(min_length=1)
+    base_currency: str = "USD"
+    rates: dict[str, Decimal]
+    rounding: Rounding = Rounding()
+
+
+class LiveOp(BaseModel):
+    op: Literal["add", "edit", "delete"]
+    expense: Expense | None = None  # add/edit
+    id: str | None = None  # delete
+
+    @model_validator(mode="after")
+    def _fields_for_op(self) -> LiveOp:
+        if self.op == "delete" and self.id is None:
+            raise ValueError("delete requires an expense id")
+        if self.op != "delete" and self.expense is None:
+            raise ValueError(f"{self.op} requires an expense")
+        return self
 
 
 class Balance(BaseModel):
@@ -44,8 +70,70 @@ class Transfer(BaseModel):
     currency: str
 
 
+class Improvement(BaseModel):
+    elapsed_ms: float
+    transfers: int
+    source: Literal["greedy", "restart"]
+
+
+class AnytimeStats(BaseModel):
+    """Improvement-versus-time statistics for tuning `time_budget_ms`."""
+
+    budget_ms: int
+    elapsed_ms: float
+    iterations: int
+    greedy_transfers: int
+    best_transfers: int
+    lower_bound: int  # no solution can use fewer transfers
+    improvements: list[Improvement]
+
+
 class SettleResponse(BaseModel):
     base_currency: str
     balances: list[Balance]
     transfers: list[Transfer]
     chart: dict[str, list]
+    stats: AnytimeStats | None = None  # anytime only
+
+
+class NetTrip(BaseModel):
+    """A trip to net: either raw (people + expenses) or already settled (balances)."""
+
+    id: str
+    people: list[str] = []
+    base_currency: str = "USD"
+    rates: dict[str, Decimal] = {}
+    expenses: list[Expense] | None = None
+    balances: list[Balance] | None = None
+
+    @model_validator(mode="after")
+    def _expenses_or_balances(self) -> NetTrip:
+        if (self.expenses is None) == (self.balances is None):
+            raise ValueError("trip needs exactly one of expenses or balances")
+        return self
+
+
+class NetHeader(BaseModel):
+    # Strict so a trip line sent in place of the NDJSON header is rejected, not absorbed
+    model_config = ConfigDict(extra="forbid")
+
+    base_currency: str = "USD"
+    rounding: Rounding = Rounding()
+
+
+class NetRequest(NetHeader):
+    model_config = ConfigDict(extra="ignore")
+
+    trips: list[NetTrip] = Field(min_length=1)
+
+
+class TripAttribution(BaseModel):
+    id: str
+    balances: list[Balance]  # this trip's contribution, in the common base
+
+
+class NetResponse(BaseModel):
+    base_currency: str
+    balances: list[Balance]
+    transfers: list[Transfer]
+    trips: list[TripAttribution]
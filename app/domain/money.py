@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from decimal import Decimal, getcontext
+from decimal import MAX_EMAX, MAX_PREC, MIN_EMIN, Context, Decimal, getcontext
 
 # High precision for all internal money calculations
 getcontext().prec = 28
 
+# Unbounded precision for accumulating balances: additions and integer multiples are
+# exact, so summing the same share n times equals share * n. Never divide in it.
+EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
 
 def to_base(amount: Decimal, currency: str, rates: Mapping[str, Decimal]) -> Decimal:
     """
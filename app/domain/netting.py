@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from decimal import Decimal
+
+from app.domain.settle import RoundingMode, accumulate_expense, round_balances
+from app.utils.errors import InvalidBalancesError
+from app.utils.validation import validate_currency_present
+
+
+def to_common_base(
+    balances: Mapping[str, Decimal],
+    trip_base: str,
+    common_base: str,
+    rates: Mapping[str, Decimal],
+) -> dict[str, Decimal]:
+    """
+    Convert balances from a trip's base into the common base.
+    Trip rates are relative to the trip base, so 1 common = rates[common] trip base.
+    """
+    if trip_base == common_base:
+        return dict(balances)
+    validate_currency_present(common_base, rates)
+    rate = rates[common_base]
+    return {p: a / rate for p, a in balances.items()}
+
+
+class TripNetting:
+    """
+    Fold trips one at a time into a single balance vector in a common base.
+    Only balances are retained per trip (for attribution), never expense lists,
+    so trips can be fed from a stream.
+    """
+
+    def __init__(self, base_currency: str, places: int = 2, mode: RoundingMode = "HALF_UP") -> None:
+        self.base_currency = base_currency
+        self.places = places
+        self.mode = mode
+        self.attribution: list[tuple[str, dict[str, Decimal]]] = []
+        self._raw: dict[str, Decimal] = {}
+
+    def add(self, trip: Mapping) -> None:
+        raw = _trip_balances(trip)
+        converted = to_common_base(
+            raw, trip.get("base_currency", "USD"), self.base_currency, trip.get("rates", {})
+        )
+        for person, amount in converted.items():
+            self._raw[person] = self._raw.get(person, Decimal("0")) + amount
+        nonzero = {p: a for p, a in converted.items() if a != 0}
+        self.attribution.append((trip["id"], round_balances(nonzero, self.places, self.mode)))
+
+    def balances(self) -> dict[str, Decimal]:
+        return round_balances(self._raw, self.places, self.mode)
+
+
+def _trip_balances(trip: Mapping) -> dict[str, Decimal]:
+    settled = trip.get("balances")
+    if settled is not None:
+        balances = {b["person"]: Decimal(b["amount"]) for b in settled}
+        if sum(balances.values(), start=Decimal("0")) != 0:
+            raise InvalidBalancesError(f"balances of trip {trip['id']} must sum to zero")
+        return balances
+
+    people = list(trip.get("people", []))
+    rates = trip.get("rates", {})
+    raw: dict[str, Decimal] = {p: Decimal("0") for p in people}
+    people_set = set(people)
+    for e in trip.get("expenses") or []:
+        accumulate_expense(raw, e, people_set, rates)
+    return raw
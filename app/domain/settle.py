@@ -2,13 +2,14 @@ from __future__ import annotations
 
 import heapq
 from collections.abc import Iterable, Mapping
-from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal, localcontext
 from typing import Literal
 
-from app.domain.money import to_base
+from app.domain.money import EXACT, to_base
 from app.domain.share import split_shares
 from app.utils.validation import (
     ensure_positive_amount,
+    ensure_positive_count,
     validate_currency_present,
     validate_participants_subset,
     validate_weights,
@@ -23,35 +24,47 @@ def _quantize(amount: Decimal, places: int = 2, mode: RoundingMode = "HALF_UP")
     return amount.quantize(q, rounding=rounding_map[mode])
 
 
-def compute_balances(
+def accumulate_expense(
+    balances: dict[str, Decimal],
+    e: Mapping,
     people: Iterable[str],
     rates: Mapping[str, Decimal],
-    expenses: Iterable[Mapping],
-    places: int = 2,
-    mode: RoundingMode = "HALF_UP",
-) -> dict[str, Decimal]:
-    balances: dict[str, Decimal] = {p: Decimal("0") for p in people}
-
-    for e in expenses:
-        payer = e["payer"]
-        amount = Decimal(e["amount"])  # accept Decimal or str
-        currency = e["currency"]
-        participants = list(e["participants"])
-
-        ensure_positive_amount(amount)
-        validate_currency_present(currency, rates)
-        validate_participants_subset(participants, people)
-        validate_weights(e.get("weights"), len(participants))
-
-        base_amount = to_base(amount, currency, rates)
-        shares = split_shares(base_amount, participants, e.get("weights"))
-
+    sign: int = 1,
+) -> None:
+    """
+    Validate one expense and add its effect to raw (unrounded) balances in place.
+    Use sign=-1 to take a previously applied expense back out.
+    """
+    payer = e["payer"]
+    amount = Decimal(e["amount"])  # accept Decimal or str
+    currency = e["currency"]
+    participants = list(e["participants"])
+    count = int(e.get("count", 1))
+
+    ensure_positive_amount(amount)
+    ensure_positive_count(count)
+    validate_currency_present(currency, rates)
+    validate_participants_subset(participants, people)
+    validate_weights(e.get("weights"), len(participants))
+
+    base_amount = to_base(amount, currency, rates)
+    shares = split_shares(base_amount, participants, e.get("weights"))
+
+    # Accumulate exactly; rounding happens only in round_balances. This keeps a repeated
+    # expense (split once, scaled by count) equal to its expanded form.
+    with localcontext(EXACT):
         # payer pays upfront
-        balances[payer] = balances.get(payer, Decimal("0")) + base_amount
+        balances[payer] = balances.get(payer, Decimal("0")) + sign * count * base_amount
         # each participant owes their share
         for person, share in shares.items():
-            balances[person] = balances.get(person, Decimal("0")) - share
+            balances[person] = balances.get(person, Decimal("0")) - sign * count * share
+
 
+def round_balances(
+    balances: Mapping[str, Decimal],
+    places: int = 2,
+    mode: RoundingMode = "HALF_UP",
+) -> dict[str, Decimal]:
     # Round to requested places for output consistency
     rounded = {p: _quantize(a, places, mode) for p, a in balances.items()}
 
@@ -75,6 +88,22 @@ def compute_balances(
     return rounded
 
 
+def compute_balances(
+    people: Iterable[str],
+    rates: Mapping[str, Decimal],
+    expenses: Iterable[Mapping],
+    places: int = 2,
+    mode: RoundingMode = "HALF_UP",
+) -> dict[str, Decimal]:
+    people = list(people)
+    balances: dict[str, Decimal] = {p: Decimal("0") for p in people}
+
+    for e in expenses:
+        accumulate_expense(balances, e, people, rates)
+
+    return round_balances(balances, places, mode)
+
+
 def suggest_transfers_greedy(
     balances: Mapping[str, Decimal],
     places: int = 2,
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, cast
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import ValidationError as PayloadError
+
+from app.domain.ledger import Ledger
+from app.domain.models import Balance, Expense, LiveOp, LiveOpen, Transfer
+from app.domain.settle import suggest_transfers_greedy
+from app.utils.errors import ValidationError
+
+router = APIRouter()
+
+
+class TripSession:
+    """A ledger shared by every client connected to the same trip id."""
+
+    def __init__(self, spec: LiveOpen) -> None:
+        self.base_currency = spec.base_currency
+        self.ledger = Ledger(
+            people=spec.people,
+            rates=spec.rates,
+            places=spec.rounding.places,
+            mode=spec.rounding.mode,
+        )
+        self.clients: set[WebSocket] = set()
+
+    def apply(self, op: LiveOp) -> None:
+        # LiveOp guarantees an id for delete and an expense for add/edit
+        if op.op == "delete":
+            self.ledger.delete(cast(str, op.id))
+            return
+        expense = cast(Expense, op.expense).model_dump()
+        if op.op == "add":
+            self.ledger.add(expense)
+        else:
+            self.ledger.edit(expense)
+
+    def message(self, kind: str, balances: dict[str, Decimal]) -> dict[str, Any]:
+        transfers_raw = suggest_transfers_greedy(
+            self.ledger.balances(), places=self.ledger.places, mode=self.ledger.mode
+        )
+        transfers = [
+            Transfer.model_validate({**t, "currency": self.base_currency}) for t in transfers_raw
+        ]
+        return {
+            "type": kind,
+            "base_currency": self.base_currency,
+            "balances": [
+                Balance(person=p, amount=a).model_dump(mode="json") for p, a in balances.items()
+            ],
+            "transfers": [t.model_dump(mode="json", by_alias=True) for t in transfers],
+        }
+
+    async def broadcast(self, message: dict[str, Any]) -> None:
+        for client in list(self.clients):
+            try:
+                await client.send_json(message)
+            except (WebSocketDisconnect, RuntimeError):
+                self.clients.discard(client)
+
+
+sessions: dict[str, TripSession] = {}
+
+
+@router.websocket("/ws/trips/{trip_id}")
+async def trip_session(websocket: WebSocket, trip_id: str) -> None:
+    # Clients send single expense operations; everyone on the trip receives only the
+    # balances that changed plus the refreshed transfer list.
+    await websocket.accept()
+    try:
+        spec = LiveOpen.model_validate_json(await websocket.receive_text())
+    except PayloadError as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1008)
+        return
+    except WebSocketDisconnect:
+        return
+
+    session = sessions.get(trip_id)
+    if session is None:
+        session = sessions[trip_id] = TripSession(spec)
+    session.clients.add(websocket)
+    try:
+        await websocket.send_json(session.message("snapshot", session.ledger.balances()))
+        while True:
+            payload = await websocket.receive_text()
+            try:
+                # malformed JSON surfaces as a pydantic error, like any other bad payload
+                session.apply(LiveOp.model_validate_json(payload))
+            except (PayloadError, ValidationError) as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            await session.broadcast(session.message("delta", session.ledger.delta()))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        session.clients.discard(websocket)
+        # Raw balances live only as long as someone is connected to the trip
+        if not session.clients and sessions.get(trip_id) is session:
+            del sessions[trip_id]
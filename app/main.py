@@ -1,29 +1,64 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from fastapi import FastAPI, Request
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 from starlette.responses import Response
 
 from app.api import router as api_router
+from app.live import router as live_router
 
-app = FastAPI(title="Trip Splitter")
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
 
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "web" / "templates"))
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "web" / "static")), name="static")
 
 
-@app.get("/health")
+def api_only_enabled() -> bool:
+    # API-only workers skip the UI (templates, static files) entirely
+    return os.environ.get("TRIP_SPLITTER_API_ONLY", "").lower() in {"1", "true", "yes"}
+
+
+@lru_cache(maxsize=1)
+def get_templates() -> Jinja2Templates:
+    # Imported and built on the first GET / so jinja2 stays off the startup path
+    from fastapi.templating import Jinja2Templates
+
+    return Jinja2Templates(directory=str(BASE_DIR / "web" / "templates"))
+
+
 def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-app.include_router(api_router)
+def index(request: Request) -> Response:
+    return get_templates().TemplateResponse(request, "index.html")
 
 
-@app.get("/")
-def index(request: Request) -> Response:
-    return templates.TemplateResponse("index.html", {"request": request})
+def create_app(
+    api_only: bool | None = None,
+    lifespan: Callable[[FastAPI], AbstractAsyncContextManager[None]] | None = None,
+) -> FastAPI:
+    if api_only is None:
+        api_only = api_only_enabled()
+
+    app = FastAPI(title="Trip Splitter", lifespan=lifespan)
+    app.get("/health")(health)
+    app.include_router(api_router)
+    app.include_router(live_router)
+
+    if not api_only:
+        from fastapi.staticfiles import StaticFiles
+
+        app.mount("/static", StaticFiles(directory=str(BASE_DIR / "web" / "static")), name="static")
+        app.get("/")(index)
+
+    return app
+
+
+app = create_app()
@@ -16,3 +16,19 @@ class InvalidParticipantsError(ValidationError):
 
 class InvalidWeightsError(ValidationError):
     pass
+
+
+class InvalidCountError(ValidationError):
+    pass
+
+
+class UnknownExpenseError(ValidationError):
+    pass
+
+
+class DuplicateExpenseError(ValidationError):
+    pass
+
+
+class InvalidBalancesError(ValidationError):
+    pass
@@ -5,6 +5,7 @@ from decimal import Decimal
 
 from .errors import (
     InvalidAmountError,
+    InvalidCountError,
     InvalidParticipantsError,
     InvalidWeightsError,
     MissingRateError,
@@ -16,6 +17,11 @@ def ensure_positive_amount(amount: Decimal) -> None:
         raise InvalidAmountError("amount must be > 0")
 
 
+def ensure_positive_count(count: int) -> None:
+    if count < 1:
+        raise InvalidCountError("count must be >= 1")
+
+
 def validate_currency_present(currency: str, rates: Mapping[str, Decimal]) -> None:
     if currency not in rates:
         raise MissingRateError(f"missing rate for currency: {currency}")
@@ -0,0 +1,209 @@
+"""
+Local HTTP load test for POST /api/settle.
+
+Starts `bench.serve:app` (app.main in API-only mode) under uvicorn on localhost for
+each worker/thread configuration, drives it open-loop at a fixed request rate with a
+weighted mix of synthetic trip sizes, and writes a JSON report that can be diffed
+between releases.
+
+    python -m bench.loadtest --rps 50 --duration 20 \
+        --mix small=0.6,medium=0.3,large=0.1 --configs 1x40,2x40,4x10 --out report.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from bench.report import summarize
+from bench.tripgen import PAYLOAD_CLASSES, generate_class
+
+ROOT = Path(__file__).resolve().parents[1]
+PAYLOADS_PER_CLASS = 20
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in PAYLOAD_CLASSES:
+            raise argparse.ArgumentTypeError(f"unknown payload class: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def parse_configs(spec: str) -> list[tuple[int, int]]:
+    """`WORKERSxTHREADS[,...]`, e.g. `1x40,2x40`."""
+    configs = []
+    for part in spec.split(","):
+        workers, _, threads = part.partition("x")
+        configs.append((int(workers), int(threads or 40)))
+    return configs
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
+
+
+def start_server(port: int, workers: int, threads: int) -> subprocess.Popen:
+    env = dict(os.environ, TRIP_SPLITTER_THREADS=str(threads))
+    cmd = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "bench.serve:app",
+        "--host",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+    ]
+    return subprocess.Popen(cmd, cwd=ROOT, env=env)
+
+
+def wait_ready(base_url: str, timeout_s: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not become ready")
+
+
+async def drive(
+    base_url: str,
+    payloads: dict[str, list[bytes]],
+    mix: dict[str, float],
+    rps: float,
+    duration_s: float,
+    seed: int,
+) -> tuple[list[tuple[str, float, bool]], float]:
+    """Open-loop load: requests are issued on schedule regardless of response times."""
+    rng = random.Random(seed)
+    classes = list(mix)
+    weights = [mix[c] for c in classes]
+    samples: list[tuple[str, float, bool]] = []
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+
+        async def one(payload_class: str, body: bytes) -> None:
+            start = time.perf_counter()
+            try:
+                resp = await client.post(
+                    "/api/settle", content=body, headers={"content-type": "application/json"}
+                )
+                ok = resp.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            samples.append((payload_class, (time.perf_counter() - start) * 1000, ok))
+
+        tasks = []
+        total = int(rps * duration_s)
+        start = time.perf_counter()
+        for i in range(total):
+            delay = start + i / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            payload_class = rng.choices(classes, weights)[0]
+            body = rng.choice(payloads[payload_class])
+            tasks.append(asyncio.create_task(one(payload_class, body)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - start
+
+    return samples, elapsed
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    rng = random.Random(args.seed)
+    payloads = {
+        c: [json.dumps(generate_class(rng, c)).encode() for _ in range(PAYLOADS_PER_CLASS)]
+        for c in args.mix
+    }
+
+    runs = []
+    for workers, threads in args.configs:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(port, workers, threads)
+        try:
+            wait_ready(base_url)
+            if args.warmup > 0:
+                asyncio.run(drive(base_url, payloads, args.mix, args.rps, args.warmup, args.seed))
+            samples, elapsed = asyncio.run(
+                drive(base_url, payloads, args.mix, args.rps, args.duration, args.seed)
+            )
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+        runs.append(
+            {
+                "workers": workers,
+                "threads": threads,
+                "elapsed_s": round(elapsed, 3),
+                "classes": summarize(samples, elapsed),
+            }
+        )
+
+    return {
+        "target": "POST /api/settle",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {
+            "rps": args.rps,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "seed": args.seed,
+            "mix": args.mix,
+            "payload_classes": {
+                c: dict(zip(("people", "expenses"), PAYLOAD_CLASSES[c], strict=True))
+                for c in args.mix
+            },
+        },
+        "runs": runs,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--rps", type=float, default=50.0, help="requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--warmup", type=float, default=2.0, help="warm-up seconds per run")
+    parser.add_argument(
+        "--mix", type=parse_mix, default="small=0.6,medium=0.3,large=0.1", help="CLASS=WEIGHT,..."
+    )
+    parser.add_argument("--configs", type=parse_configs, default="1x40", help="WORKERSxTHREADS,...")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="write JSON report here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args), indent=2, sort_keys=True)
+    if args.out:
+        args.out.write_text(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
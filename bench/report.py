@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _percentile_ms(sorted_values: Sequence[float], pct: float) -> float | None:
+    # None rather than NaN so the report stays valid JSON when a class only has errors
+    if not sorted_values:
+        return None
+    return round(percentile(sorted_values, pct), 3)
+
+
+def summarize(
+    samples: Iterable[tuple[str, float, bool]], duration_s: float
+) -> dict[str, dict[str, Any]]:
+    """
+    Aggregate (payload_class, latency_ms, ok) samples per class plus an "all" row.
+    Throughput counts successful responses only.
+    """
+    by_class: dict[str, list[tuple[float, bool]]] = {}
+    for payload_class, latency_ms, ok in samples:
+        by_class.setdefault(payload_class, []).append((latency_ms, ok))
+        by_class.setdefault("all", []).append((latency_ms, ok))
+
+    summary: dict[str, dict[str, Any]] = {}
+    for payload_class, rows in sorted(by_class.items()):
+        latencies = sorted(lat for lat, ok in rows if ok)
+        summary[payload_class] = {
+            "requests": len(rows),
+            "errors": sum(1 for _, ok in rows if not ok),
+            "throughput_rps": round(len(latencies) / duration_s, 2) if duration_s else 0.0,
+            "p50_ms": _percentile_ms(latencies, 50),
+            "p95_ms": _percentile_ms(latencies, 95),
+            "p99_ms": _percentile_ms(latencies, 99),
+        }
+    return summary
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
+from fastapi import FastAPI
+
+from app.main import create_app
+
+
+@asynccontextmanager
+async def _size_thread_pool(app: FastAPI) -> AsyncIterator[None]:
+    # Sync endpoints (e.g. /api/settle) run in anyio's thread pool; the load test varies
+    # its size per run through TRIP_SPLITTER_THREADS.
+    threads = os.environ.get("TRIP_SPLITTER_THREADS")
+    if threads:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = int(threads)
+    yield
+
+
+app = create_app(api_only=True, lifespan=_size_thread_pool)
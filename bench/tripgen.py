@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import random
+from typing import Any
+
+# payload class -> (people, expenses)
+PAYLOAD_CLASSES: dict[str, tuple[int, int]] = {
+    "small": (3, 5),
+    "medium": (10, 50),
+    "large": (50, 500),
+}
+
+RATES = {"USD": "1", "EUR": "1.08", "CHF": "1.10", "JPY": "0.0067"}
+
+
+def generate_trip(rng: random.Random, people: int, expenses: int) -> dict[str, Any]:
+    """Build a random but valid /api/settle payload."""
+    names = [f"p{i}" for i in range(people)]
+    currencies = list(RATES)
+    items = []
+    for i in range(expenses):
+        participants = rng.sample(names, rng.randint(1, people))
+        expense: dict[str, Any] = {
+            "id": f"e{i}",
+            "payer": rng.choice(names),
+            "amount": f"{rng.randint(100, 100_000) / 100:.2f}",
+            "currency": rng.choice(currencies),
+            "participants": participants,
+        }
+        if rng.random() < 0.2:
+            expense["weights"] = [str(rng.randint(1, 4)) for _ in participants]
+        items.append(expense)
+    return {
+        "people": names,
+        "base_currency": "USD",
+        "rates": RATES,
+        "rounding": {"mode": "HALF_UP", "places": 2},
+        "expenses": items,
+    }
+
+
+def generate_class(rng: random.Random, payload_class: str) -> dict[str, Any]:
+    people, expenses = PAYLOAD_CLASSES[payload_class]
+    return generate_trip(rng, people, expenses)
@@ -0,0 +1,52 @@
+import random
+from decimal import Decimal
+
+from app.domain.anytime import suggest_transfers_anytime
+from app.domain.settle import suggest_transfers_greedy
+
+
+def _settles(balances, transfers):
+    net = {p: Decimal("0") for p in balances}
+    for t in transfers:
+        net[t["from"]] += t["amount"]
+        net[t["to"]] -= t["amount"]
+    return all(net[p] == -balances[p] for p in balances)
+
+
+def test_should_beat_greedy_by_finding_zero_sum_subgroups():
+    # {B, F, A} and {C, D, E} both sum to zero -> 2 + 2 transfers; greedy needs 5
+    balances = {
+        "A": Decimal("-5.00"),
+        "B": Decimal("2.00"),
+        "C": Decimal("-4.00"),
+        "D": Decimal("8.00"),
+        "E": Decimal("-4.00"),
+        "F": Decimal("3.00"),
+    }
+    transfers, stats = suggest_transfers_anytime(balances, budget_ms=200)
+    assert len(suggest_transfers_greedy(balances)) == 5
+    assert len(transfers) == 4
+    assert _settles(balances, transfers)
+    assert stats["greedy_transfers"] == 5
+    assert stats["best_transfers"] == 4
+    assert [i["transfers"] for i in stats["improvements"]] == [5, 4]
+    assert [i["source"] for i in stats["improvements"]] == ["greedy", "restart"]
+
+
+def test_should_never_be_worse_than_greedy_and_respect_budget():
+    rng = random.Random(7)
+    balances = {f"p{i}": Decimal(rng.randint(-5000, 5000)) / 100 for i in range(200)}
+    balances["p0"] -= sum(balances.values())
+
+    transfers, stats = suggest_transfers_anytime(balances, budget_ms=100)
+
+    assert len(transfers) <= len(suggest_transfers_greedy(balances))
+    assert len(transfers) >= stats["lower_bound"]
+    assert _settles(balances, transfers)
+    assert stats["elapsed_ms"] < 1000
+
+
+def test_should_return_no_transfers_when_all_settled():
+    transfers, stats = suggest_transfers_anytime({"A": Decimal("0"), "B": Decimal("0")})
+    assert transfers == []
+    assert stats["iterations"] == 0
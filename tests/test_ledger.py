@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError as PayloadError
+
+from app.domain.ledger import Ledger
+from app.domain.models import LiveOp
+from app.domain.settle import compute_balances
+from app.utils.errors import DuplicateExpenseError, InvalidAmountError, UnknownExpenseError
+
+PEOPLE = ["Alice", "Bob", "Carol"]
+RATES = {"USD": Decimal("1"), "CHF": Decimal("1.10"), "EUR": Decimal("1.08")}
+
+
+def _expense(id, payer, amount, currency, participants):
+    return dict(
+        id=id, payer=payer, amount=Decimal(amount), currency=currency, participants=participants
+    )
+
+
+def test_should_match_batch_balances_after_incremental_adds():
+    expenses = [
+        _expense("e1", "Alice", "90", "CHF", ["Alice", "Bob"]),
+        _expense("e2", "Bob", "150", "USD", ["Alice", "Bob", "Carol"]),
+        _expense("e3", "Carol", "120", "EUR", ["Alice", "Carol"]),
+    ]
+    ledger = Ledger(PEOPLE, RATES)
+    for e in expenses:
+        ledger.add(e)
+    assert ledger.balances() == compute_balances(PEOPLE, RATES, expenses)
+
+
+def test_should_report_only_changed_balances_in_delta():
+    ledger = Ledger(PEOPLE, RATES)
+    ledger.add(_expense("e1", "Alice", "60", "USD", ["Alice", "Bob"]))
+    assert ledger.delta() == {"Alice": Decimal("30.00"), "Bob": Decimal("-30.00")}
+
+    ledger.add(_expense("e2", "Bob", "30", "USD", ["Bob", "Carol"]))
+    assert ledger.delta() == {"Bob": Decimal("-15.00"), "Carol": Decimal("-15.00")}
+    assert ledger.delta() == {}
+
+
+def test_should_edit_and_delete_expenses():
+    ledger = Ledger(PEOPLE, RATES)
+    ledger.add(_expense("e1", "Alice", "60", "USD", ["Alice", "Bob"]))
+    ledger.edit(_expense("e1", "Alice", "90", "USD", ["Alice", "Bob", "Carol"]))
+    assert ledger.balances() == {
+        "Alice": Decimal("60.00"),
+        "Bob": Decimal("-30.00"),
+        "Carol": Decimal("-30.00"),
+    }
+
+    ledger.delete("e1")
+    assert ledger.balances() == {p: Decimal("0.00") for p in PEOPLE}
+    assert ledger.expenses == {}
+
+
+def test_should_leave_ledger_untouched_when_edit_is_invalid():
+    ledger = Ledger(PEOPLE, RATES)
+    ledger.add(_expense("e1", "Alice", "60", "USD", ["Alice", "Bob"]))
+    before = ledger.balances()
+    with pytest.raises(InvalidAmountError):
+        ledger.edit(_expense("e1", "Alice", "0", "USD", ["Alice", "Bob"]))
+    assert ledger.balances() == before
+
+
+def test_should_reject_duplicate_and_unknown_expense_ids():
+    ledger = Ledger(PEOPLE, RATES)
+    ledger.add(_expense("e1", "Alice", "60", "USD", ["Alice", "Bob"]))
+    with pytest.raises(DuplicateExpenseError):
+        ledger.add(_expense("e1", "Bob", "10", "USD", ["Bob"]))
+    with pytest.raises(UnknownExpenseError):
+        ledger.delete("missing")
+
+
+def test_should_reject_live_ops_missing_their_payload():
+    with pytest.raises(PayloadError):
+        LiveOp.model_validate({"op": "delete"})
+    with pytest.raises(PayloadError):
+        LiveOp.model_validate({"op": "add", "id": "e1"})
@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+OPEN = {
+    "op": "open",
+    "people": ["Alice", "Bob", "Carol"],
+    "base_currency": "USD",
+    "rates": {"USD": "1", "CHF": "1.10"},
+}
+
+
+def _balances(message):
+    return {b["person"]: Decimal(b["amount"]) for b in message["balances"]}
+
+
+def test_should_push_changed_balances_and_transfers_to_all_clients():
+    # One TestClient context so every connection shares the same event loop portal
+    with TestClient(app) as client, client.websocket_connect("/ws/trips/t1") as alice:
+        alice.send_json(OPEN)
+        snapshot = alice.receive_json()
+        assert snapshot["type"] == "snapshot"
+        assert _balances(snapshot) == {p: Decimal("0") for p in OPEN["people"]}
+
+        with client.websocket_connect("/ws/trips/t1") as bob:
+            bob.send_json(OPEN)
+            assert bob.receive_json()["type"] == "snapshot"
+
+            alice.send_json(
+                {
+                    "op": "add",
+                    "expense": {
+                        "id": "e1",
+                        "payer": "Alice",
+                        "amount": "90",
+                        "currency": "CHF",
+                        "participants": ["Alice", "Bob"],
+                    },
+                }
+            )
+            for ws in (alice, bob):
+                delta = ws.receive_json()
+                assert delta["type"] == "delta"
+                assert _balances(delta) == {"Alice": Decimal("49.50"), "Bob": Decimal("-49.50")}
+                assert delta["transfers"] == [
+                    {"from": "Bob", "to": "Alice", "amount": "49.50", "currency": "USD"}
+                ]
+
+            bob.send_json({"op": "delete", "id": "e1"})
+            delta = alice.receive_json()
+            assert _balances(delta) == {"Alice": Decimal("0"), "Bob": Decimal("0")}
+            assert delta["transfers"] == []
+            bob.receive_json()
+
+
+def test_should_send_error_for_invalid_operation_without_closing():
+    with TestClient(app) as client, client.websocket_connect("/ws/trips/t2") as ws:
+        ws.send_json(OPEN)
+        ws.receive_json()
+        ws.send_json({"op": "delete", "id": "missing"})
+        assert ws.receive_json() == {"type": "error", "detail": "unknown expense id: missing"}
+        ws.send_json({"op": "edit"})
+        error = ws.receive_json()
+        assert error["type"] == "error"
+        assert "edit requires an expense" in error["detail"]
+
+
+def test_should_keep_socket_open_after_non_json_frame():
+    with TestClient(app) as client, client.websocket_connect("/ws/trips/t3") as ws:
+        ws.send_json(OPEN)
+        ws.receive_json()
+        ws.send_text("not json")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"op": "delete", "id": "missing"})
+        assert ws.receive_json() == {"type": "error", "detail": "unknown expense id: missing"}
@@ -0,0 +1,43 @@
+import json
+import random
+from decimal import Decimal
+
+from app.domain.settle import compute_balances
+from bench.report import percentile, summarize
+from bench.tripgen import PAYLOAD_CLASSES, generate_class
+
+
+def test_should_compute_nearest_rank_percentiles():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_should_summarize_latency_per_payload_class():
+    samples = [("small", 10.0, True), ("small", 20.0, True), ("large", 100.0, False)]
+    summary = summarize(samples, duration_s=2.0)
+    assert summary["small"]["requests"] == 2
+    assert summary["small"]["throughput_rps"] == 1.0
+    assert summary["small"]["p99_ms"] == 20.0
+    assert summary["large"]["errors"] == 1
+    assert summary["all"]["requests"] == 3
+
+
+def test_should_emit_null_percentiles_for_class_with_only_errors():
+    summary = summarize([("large", 100.0, False), ("large", 120.0, False)], duration_s=1.0)
+    assert summary["large"]["throughput_rps"] == 0.0
+    assert summary["large"]["p50_ms"] is None
+    assert summary["large"]["p99_ms"] is None
+    json.dumps(summary, allow_nan=False)
+
+
+def test_should_generate_valid_synthetic_trips_deterministically():
+    for payload_class, (people, expenses) in PAYLOAD_CLASSES.items():
+        trip = generate_class(random.Random(1), payload_class)
+        assert trip == generate_class(random.Random(1), payload_class)
+        assert len(trip["people"]) == people
+        assert len(trip["expenses"]) == expenses
+        rates = {c: Decimal(r) for c, r in trip["rates"].items()}
+        compute_balances(trip["people"], rates, trip["expenses"])
@@ -0,0 +1,88 @@
+import json
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+TRIPS = [
+    {
+        "id": "t1",
+        "people": ["Alice", "Bob"],
+        "base_currency": "USD",
+        "rates": {"USD": "1"},
+        "expenses": [
+            {
+                "id": "e1",
+                "payer": "Alice",
+                "amount": "40",
+                "currency": "USD",
+                "participants": ["Alice", "Bob"],
+            }
+        ],
+    },
+    {
+        "id": "t2",
+        "base_currency": "EUR",
+        "rates": {"EUR": "1", "USD": "0.8"},
+        "balances": [{"person": "Bob", "amount": "16"}, {"person": "Carol", "amount": "-16"}],
+    },
+]
+
+
+def _check(data):
+    balances = {b["person"]: Decimal(b["amount"]) for b in data["balances"]}
+    assert balances == {"Alice": Decimal("20"), "Bob": Decimal("0"), "Carol": Decimal("-20")}
+    assert data["transfers"] == [
+        {"from": "Carol", "to": "Alice", "amount": "20.00", "currency": "USD"}
+    ]
+    assert [t["id"] for t in data["trips"]] == ["t1", "t2"]
+
+
+def test_should_net_trips_into_single_settlement():
+    client = TestClient(app)
+    resp = client.post("/api/net", json={"base_currency": "USD", "trips": TRIPS})
+    assert resp.status_code == 200
+    _check(resp.json())
+
+
+def test_should_net_trips_streamed_as_ndjson():
+    client = TestClient(app)
+    lines = [json.dumps({"base_currency": "USD"})] + [json.dumps(t) for t in TRIPS]
+    resp = client.post(
+        "/api/net/stream",
+        content="\n".join(lines).encode(),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    _check(resp.json())
+
+
+def test_should_return_422_when_trip_has_neither_expenses_nor_balances():
+    client = TestClient(app)
+    resp = client.post("/api/net", json={"trips": [{"id": "t1"}]})
+    assert resp.status_code == 422
+
+
+def test_should_parse_ndjson_lines_split_across_chunks():
+    client = TestClient(app)
+    body = "\n".join([json.dumps({"base_currency": "USD"})] + [json.dumps(t) for t in TRIPS])
+    chunks = [body[i : i + 7].encode() for i in range(0, len(body), 7)]
+    resp = client.post(
+        "/api/net/stream",
+        content=iter(chunks),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    _check(resp.json())
+
+
+def test_should_reject_ndjson_stream_without_header_line():
+    client = TestClient(app)
+    resp = client.post(
+        "/api/net/stream",
+        content="\n".join(json.dumps(t) for t in TRIPS).encode(),
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 422
+    assert resp.json()["detail"].startswith("line 1:")
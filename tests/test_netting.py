@@ -0,0 +1,60 @@
+from decimal import Decimal
+
+import pytest
+
+from app.domain.netting import TripNetting, to_common_base
+from app.utils.errors import InvalidBalancesError, MissingRateError
+
+
+def test_should_convert_trip_balances_into_common_base():
+    rates = {"EUR": Decimal("1"), "USD": Decimal("0.8")}  # 1 USD = 0.8 EUR
+    converted = to_common_base({"A": Decimal("8"), "B": Decimal("-8")}, "EUR", "USD", rates)
+    assert converted == {"A": Decimal("10"), "B": Decimal("-10")}
+
+
+def test_should_require_rate_for_common_base():
+    with pytest.raises(MissingRateError):
+        to_common_base({"A": Decimal("1")}, "EUR", "USD", {"EUR": Decimal("1")})
+
+
+def test_should_net_raw_and_settled_trips_with_attribution():
+    netting = TripNetting("USD")
+    netting.add(
+        dict(
+            id="t1",
+            people=["A", "B"],
+            base_currency="USD",
+            rates={"USD": Decimal("1")},
+            expenses=[
+                dict(id="e1", payer="A", amount=Decimal("20"), currency="USD", participants=["B"])
+            ],
+        )
+    )
+    netting.add(
+        dict(
+            id="t2",
+            base_currency="EUR",
+            rates={"EUR": Decimal("1"), "USD": Decimal("0.8")},
+            balances=[
+                dict(person="B", amount=Decimal("8")),
+                dict(person="C", amount=Decimal("-8")),
+            ],
+        )
+    )
+
+    # A is owed 20 by B; B is owed 10 by C -> netted B only owes 10
+    assert netting.balances() == {
+        "A": Decimal("20.00"),
+        "B": Decimal("-10.00"),
+        "C": Decimal("-10.00"),
+    }
+    assert netting.attribution == [
+        ("t1", {"A": Decimal("20.00"), "B": Decimal("-20.00")}),
+        ("t2", {"B": Decimal("10.00"), "C": Decimal("-10.00")}),
+    ]
+
+
+def test_should_reject_settled_trip_that_does_not_sum_to_zero():
+    netting = TripNetting("USD")
+    with pytest.raises(InvalidBalancesError):
+        netting.add(dict(id="t1", balances=[dict(person="A", amount=Decimal("1"))]))
@@ -118,3 +118,67 @@ def test_should_render_index_page_with_chart_js():
     resp = client.get("/")
     assert resp.status_code == 200
     assert b"Chart" in resp.content
+
+
+def test_should_return_anytime_transfers_with_improvement_stats():
+    client = TestClient(app)
+    payload = {
+        "people": ["A", "B", "C", "D", "E", "F"],
+        "rates": {"USD": "1"},
+        "expenses": [
+            {"id": "e1", "payer": "B", "amount": "2", "currency": "USD", "participants": ["A"]},
+            {"id": "e2", "payer": "F", "amount": "3", "currency": "USD", "participants": ["A"]},
+            {
+                "id": "e3",
+                "payer": "D",
+                "amount": "8",
+                "currency": "USD",
+                "participants": ["C", "E"],
+            },
+        ],
+        "optimize": "anytime",
+        "time_budget_ms": 200,
+    }
+    resp = client.post("/api/settle", json=payload)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data["transfers"]) == 4
+    assert data["stats"]["greedy_transfers"] == 5
+    assert data["stats"]["best_transfers"] == 4
+    assert data["stats"]["improvements"][-1]["transfers"] == 4
+    assert data["stats"]["improvements"][-1]["source"] == "restart"
+
+
+def test_should_document_anytime_stats_in_openapi_schema():
+    client = TestClient(app)
+    schemas = client.get("/openapi.json").json()["components"]["schemas"]
+    assert set(schemas["AnytimeStats"]["properties"]) == {
+        "budget_ms",
+        "elapsed_ms",
+        "iterations",
+        "greedy_transfers",
+        "best_transfers",
+        "lower_bound",
+        "improvements",
+    }
+    assert set(schemas["Improvement"]["properties"]) == {"elapsed_ms", "transfers", "source"}
+
+
+def test_should_return_422_when_expense_count_is_out_of_range():
+    client = TestClient(app)
+    payload = {
+        "people": ["Alice", "Bob"],
+        "rates": {"USD": "1"},
+        "expenses": [
+            {
+                "id": "e1",
+                "payer": "Alice",
+                "amount": "1",
+                "currency": "USD",
+                "participants": ["Alice", "Bob"],
+                "count": 10**30,
+            }
+        ],
+    }
+    resp = client.post("/api/settle", json=payload)
+    assert resp.status_code == 422
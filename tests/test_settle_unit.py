@@ -1,9 +1,15 @@
+import random
 from decimal import Decimal
 
 import pytest
 
 from app.domain.settle import compute_balances, suggest_transfers_greedy
-from app.utils.errors import InvalidAmountError, InvalidParticipantsError, MissingRateError
+from app.utils.errors import (
+    InvalidAmountError,
+    InvalidCountError,
+    InvalidParticipantsError,
+    MissingRateError,
+)
 
 
 def test_should_compute_balances_for_mixed_currencies():
@@ -200,3 +206,80 @@ def test_should_respect_rounding_modes_in_balances_and_transfers():
 
     assert transfers_up == [{"from": "B", "to": "A", "amount": Decimal("0.13")}]
     assert transfers_even == [{"from": "B", "to": "A", "amount": Decimal("0.12")}]
+
+
+def test_should_treat_count_as_repeated_expense_equal_to_expanded_form():
+    people = ["Alice", "Bob", "Carol"]
+    rates = {"USD": Decimal("1"), "EUR": Decimal("1.08")}
+    breakfast = dict(
+        id="b",
+        payer="Alice",
+        amount=Decimal("17.35"),
+        currency="EUR",
+        participants=["Alice", "Bob", "Carol"],
+    )
+    hotel = dict(
+        id="h",
+        payer="Bob",
+        amount=Decimal("133.33"),
+        currency="USD",
+        participants=["Bob", "Carol"],
+        weights=[Decimal("1"), Decimal("2")],
+    )
+    expanded = [breakfast] * 21 + [hotel] * 14
+    compressed = [dict(breakfast, count=21), dict(hotel, count=14)]
+
+    assert compute_balances(people, rates, compressed) == compute_balances(people, rates, expanded)
+
+
+def test_should_reject_non_positive_count():
+    people = ["A", "B"]
+    rates = {"USD": Decimal("1")}
+    expenses = [
+        dict(
+            id="e1",
+            payer="A",
+            amount=Decimal("10"),
+            currency="USD",
+            participants=["A", "B"],
+            count=0,
+        )
+    ]
+    with pytest.raises(InvalidCountError):
+        compute_balances(people, rates, expenses)
+
+
+def test_should_split_one_third_times_fifty_like_fifty_expanded_copies():
+    people = ["A", "B", "C"]
+    rates = {"USD": Decimal("1")}
+    expense = dict(id="e1", payer="A", amount=Decimal("1.00"), currency="USD", participants=people)
+
+    compressed = compute_balances(people, rates, [dict(expense, count=50)])
+
+    assert compressed == compute_balances(people, rates, [expense] * 50)
+
+
+def test_should_match_expanded_form_for_random_amounts_counts_and_splits():
+    rng = random.Random(0)
+    people = ["A", "B", "C", "D", "E", "F", "G"]
+    rates = {"USD": Decimal("1"), "EUR": Decimal("1.08"), "JPY": Decimal("0.0067")}
+    for _ in range(300):
+        compressed, expanded = [], []
+        for i in range(rng.randint(1, 4)):
+            participants = rng.sample(people, rng.randint(1, len(people)))
+            expense = dict(
+                id=f"e{i}",
+                payer=rng.choice(people),
+                amount=Decimal(rng.randint(1, 1_000_000)) / 100,
+                currency=rng.choice(list(rates)),
+                participants=participants,
+            )
+            if rng.random() < 0.3:
+                expense["weights"] = [Decimal(rng.randint(1, 7)) for _ in participants]
+            count = rng.randint(1, 60)
+            compressed.append(dict(expense, count=count))
+            expanded.extend([expense] * count)
+        for mode in ("HALF_UP", "HALF_EVEN"):
+            assert compute_balances(people, rates, compressed, mode=mode) == compute_balances(
+                people, rates, expanded, mode=mode
+            )
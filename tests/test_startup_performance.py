@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Budgets in milliseconds, ~1.5x the measured medians (import ~430 ms, first request
+# ~490 ms on a dev box) so small startup regressions fail; override via env on slower CI
+IMPORT_BUDGET_MS = float(os.environ.get("TRIP_SPLITTER_IMPORT_BUDGET_MS", "650"))
+FIRST_REQUEST_BUDGET_MS = float(os.environ.get("TRIP_SPLITTER_FIRST_REQUEST_BUDGET_MS", "750"))
+
+# Process start to first response, including the import of app.main
+FIRST_REQUEST_SCRIPT = """
+import sys
+import time
+start = time.perf_counter()
+from fastapi.testclient import TestClient
+from app.main import app
+resp = TestClient(app).get(sys.argv[1])
+assert resp.status_code == 200, resp.status_code
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def _run(args, api_only=True):
+    env = dict(os.environ, TRIP_SPLITTER_API_ONLY="1" if api_only else "0")
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _import_times(api_only=True):
+    """Parse `python -X importtime` output into {module: cumulative microseconds}."""
+    stderr = _run(["-X", "importtime", "-c", "import app.main"], api_only).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_should_import_app_within_budget():
+    times = _import_times()
+    assert times["app.main"] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_should_not_import_templates_on_api_only_workers():
+    assert "jinja2" not in _import_times(api_only=True)
+
+
+def test_should_defer_template_import_until_first_index_request_in_ui_mode():
+    assert "jinja2" not in _import_times(api_only=False)
+
+
+def test_should_serve_first_request_within_budget():
+    elapsed_ms = float(_run(["-c", FIRST_REQUEST_SCRIPT, "/health"]).stdout.strip())
+    assert elapsed_ms < FIRST_REQUEST_BUDGET_MS
+
+
+def test_should_render_first_index_page_within_budget():
+    # UI mode: templates are built lazily on this first GET /
+    elapsed_ms = float(_run(["-c", FIRST_REQUEST_SCRIPT, "/"], api_only=False).stdout.strip())
+    assert elapsed_ms < FIRST_REQUEST_BUDGET_MS
@@ -12,3 +12,11 @@ def test_should_render_template_when_cwd_diff(tmp_path, monkeypatch):
     resp = client.get("/")
     assert resp.status_code == 200
     assert b"Trip Splitter" in resp.content
+
+
+def test_should_skip_ui_routes_in_api_only_mode():
+    from app.main import create_app
+
+    client = TestClient(create_app(api_only=True))
+    assert client.get("/").status_code == 404
+    assert client.get("/health").status_code == 200